@@ -5,20 +5,85 @@ This module handles retrieving incident data from the GitHub Status API.
 It provides functionality to make HTTP requests to the GitHub Status API
 and handle any errors that may occur during the process.
 """
+import asyncio
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, the cache falls back to JSON
+    msgpack = None
+
+
+def json_loads(payload: bytes) -> Any:
+    """
+    Parse a JSON document from raw bytes.
+    
+    Uses orjson when it is installed, which decodes straight from bytes
+    without an intermediate str, and the standard library otherwise.
+    
+    Args:
+        payload (bytes): The JSON document to parse
+        
+    Returns:
+        Any: The parsed document
+        
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to a JSON document as UTF-8 bytes.
+    
+    Args:
+        obj (Any): The object to serialize
+        
+    Returns:
+        bytes: The serialized JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session configured for fetching from status page APIs.
+    
+    The session keeps connections alive in a pool so repeat fetches skip the
+    TCP/TLS handshake, and retries transient gateway errors. Several fetchers
+    can share one session to reuse the same connections. Compressed responses
+    are requested by requests' default Accept-Encoding, which also offers
+    brotli and zstd when their decoders are installed.
+    
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    ))
+    return session
 
 
 class RequestError(Exception):
@@ -59,9 +124,12 @@ class DataFetcher:
     caching functionality to reduce API calls for frequent runs.
     """
     
+    logger = logging.getLogger(__name__)
+    
     def __init__(self, api_url: str = "https://www.githubstatus.com/api/v2/incidents.json", 
                  cache_dir: str = ".cache", 
-                 cache_ttl: int = 3600):
+                 cache_ttl: int = 3600,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the DataFetcher with the GitHub Status API URL and caching options.
         
@@ -69,91 +137,159 @@ class DataFetcher:
             api_url (str): The URL of the GitHub Status API. Defaults to the official endpoint.
             cache_dir (str): Directory to store cache files. Defaults to ".cache".
             cache_ttl (int): Cache time-to-live in seconds. Defaults to 1 hour (3600 seconds).
+            session (requests.Session, optional): Session to send requests through, e.g. one
+                from create_session() shared by several fetchers so that they reuse the same
+                pooled connections. Defaults to a new session owned by this fetcher.
         """
         self.api_url = api_url
         self.cache_dir = cache_dir
         self.cache_ttl = cache_ttl
-        self.logger = logger
+        
+        # Most recent (timestamp, data) pair, so repeat calls in the same
+        # process skip reading and parsing the cache file
+        self._mem_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Only close the session on close() if this fetcher created it
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
         
         # Create cache directory if it doesn't exist
-        if not os.path.exists(self.cache_dir):
-            try:
-                os.makedirs(self.cache_dir)
-                self.logger.info(f"Created cache directory: {self.cache_dir}")
-            except OSError as e:
-                self.logger.warning(f"Failed to create cache directory: {str(e)}")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to create cache directory: {str(e)}")
+        
+        # The API URL never changes, so derive the cache file name once. Hashing
+        # keeps the name filesystem-safe whatever characters the URL contains.
+        # The cache is only ever read back by this class, so store it as
+        # msgpack when available, which decodes faster than JSON
+        filename = hashlib.blake2b(self.api_url.encode(), digest_size=16).hexdigest()
+        self._cache_msgpack = msgpack is not None
+        extension = 'msgpack' if self._cache_msgpack else 'json'
+        self._cache_path = os.path.join(self.cache_dir, f"{filename}.{extension}")
+        self._cache_temp_path = f"{self._cache_path}.tmp"
+        # A JSON cache written before msgpack was installed is still read back
+        self._legacy_cache_path = (
+            os.path.join(self.cache_dir, f"{filename}.json") if self._cache_msgpack else None
+        )
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections, if owned."""
+        if self._owns_session:
+            self._session.close()
     
     def _get_cache_path(self) -> str:
         """
-        Generate a cache file path based on the API URL.
+        Get the cache file path for the API URL.
         
         Returns:
             str: Path to the cache file
         """
-        # Create a filename based on the API URL (removing special characters)
-        filename = self.api_url.replace('://', '_').replace('/', '_').replace('?', '_').replace('&', '_')
-        return os.path.join(self.cache_dir, f"{filename}.json")
+        return self._cache_path
+    
+    def _read_cache_file(self) -> Any:
+        """
+        Read and decode the cache file, falling back to a legacy JSON cache file.
+        
+        Returns:
+            Any: The decoded cache file contents
+            
+        Raises:
+            FileNotFoundError: If there is no cache file
+            ValueError: If the cache file cannot be decoded
+        """
+        try:
+            with open(self._cache_path, 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            if self._legacy_cache_path is None:
+                raise
+            with open(self._legacy_cache_path, 'rb') as f:
+                self.logger.debug(f"Reading legacy JSON cache file: {self._legacy_cache_path}")
+                return json_loads(f.read())
+        
+        if self._cache_msgpack:
+            return msgpack.unpackb(payload, raw=False)
+        return json_loads(payload)
     
     def _load_from_cache(self) -> Tuple[Optional[Dict[str, Any]], bool]:
         """
-        Load incident data from cache if available and not expired.
+        Load the cache entry for the API URL and check whether it has expired.
+        
+        Expired entries are still returned so that their ETag and Last-Modified
+        validators can be replayed in a conditional request.
         
         Returns:
             Tuple[Optional[Dict[str, Any]], bool]: Tuple containing:
-                - The cached data if available and valid, None otherwise
-                - Boolean indicating if the cache was used
+                - The cache entry ('timestamp', 'data' and the optional 'etag'
+                  and 'last_modified' validators) if available, None otherwise
+                - Boolean indicating if the entry is fresh and can be used as-is
         """
-        cache_path = self._get_cache_path()
+        cache_path = self._cache_path
         
-        if not os.path.exists(cache_path):
+        try:
+            cache_data = self._read_cache_file()
+            
+            # Check if the cache has metadata
+            if not isinstance(cache_data, dict) or 'timestamp' not in cache_data or 'data' not in cache_data:
+                self.logger.warning("Cache file has invalid format, ignoring")
+                return None, False
+            
+            # Check if the cache is expired
+            cache_age = time.time() - cache_data['timestamp']
+            cache_fresh = cache_age <= self.cache_ttl
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                cache_time = datetime.fromtimestamp(cache_data['timestamp']).isoformat()
+                if cache_fresh:
+                    self.logger.info(f"Using cached data from {cache_time}")
+                else:
+                    self.logger.info(f"Cache expired (created {cache_time})")
+            
+            return cache_data, cache_fresh
+            
+        except FileNotFoundError:
             self.logger.debug(f"Cache file not found: {cache_path}")
             return None, False
-        
-        try:
-            with open(cache_path, 'r') as f:
-                cache_data = json.load(f)
-                
-                # Check if the cache has metadata
-                if not isinstance(cache_data, dict) or 'timestamp' not in cache_data or 'data' not in cache_data:
-                    self.logger.warning("Cache file has invalid format, ignoring")
-                    return None, False
-                
-                # Check if the cache is expired
-                cache_time = datetime.fromtimestamp(cache_data['timestamp'])
-                current_time = datetime.now()
-                
-                if (current_time - cache_time).total_seconds() > self.cache_ttl:
-                    self.logger.info(f"Cache expired (created {cache_time.isoformat()})")
-                    return None, False
-                
-                self.logger.info(f"Using cached data from {cache_time.isoformat()}")
-                return cache_data['data'], True
-                
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             self.logger.warning(f"Failed to load cache file: {str(e)}")
             return None, False
     
-    def _save_to_cache(self, data: Dict[str, Any]) -> bool:
+    def _save_to_cache(self, data: Dict[str, Any], etag: Optional[str] = None,
+                       last_modified: Optional[str] = None) -> bool:
         """
         Save incident data to cache.
         
         Args:
             data (Dict[str, Any]): The data to cache
+            etag (Optional[str]): The ETag header of the response, if any
+            last_modified (Optional[str]): The Last-Modified header of the response, if any
             
         Returns:
             bool: True if the data was successfully cached, False otherwise
         """
-        cache_path = self._get_cache_path()
+        cache_path = self._cache_path
         
         try:
             # Create a cache object with metadata
             cache_data = {
                 'timestamp': time.time(),
+                'etag': etag,
+                'last_modified': last_modified,
                 'data': data
             }
             
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f)
+            # Write to a temporary file and rename it into place, so a crash
+            # mid-write can never leave a truncated cache file behind
+            temp_path = self._cache_temp_path
+            with open(temp_path, 'wb') as f:
+                if self._cache_msgpack:
+                    f.write(msgpack.packb(cache_data, use_bin_type=True))
+                else:
+                    f.write(json_dumps(cache_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, cache_path)
                 
             self.logger.info(f"Data cached successfully at {cache_path}")
             return True
@@ -178,11 +314,16 @@ class DataFetcher:
             CacheError: If there is an issue with cache operations
         """
         # Try to load from cache first if caching is enabled
+        cache_entry = None
         if use_cache:
+            if self._mem_cache is not None and time.time() - self._mem_cache[0] <= self.cache_ttl:
+                return self._mem_cache[1]
+            
             try:
-                cached_data, cache_used = self._load_from_cache()
-                if cache_used and cached_data is not None:
-                    return cached_data
+                cache_entry, cache_fresh = self._load_from_cache()
+                if cache_fresh:
+                    self._mem_cache = (cache_entry['timestamp'], cache_entry['data'])
+                    return cache_entry['data']
             except Exception as e:
                 # Log the error but continue to fetch from API
                 self.logger.warning(f"Cache error: {str(e)}")
@@ -190,8 +331,17 @@ class DataFetcher:
         # If cache is not used or not available, fetch from API
         self.logger.info(f"Fetching incidents from {self.api_url}")
         
+        # Replay the validators of an expired entry so the server can answer
+        # 304 Not Modified instead of sending the full payload again
+        headers = {}
+        if cache_entry is not None:
+            if cache_entry.get('etag'):
+                headers['If-None-Match'] = cache_entry['etag']
+            if cache_entry.get('last_modified'):
+                headers['If-Modified-Since'] = cache_entry['last_modified']
+        
         try:
-            response = requests.get(self.api_url, timeout=30)
+            response = self._session.get(self.api_url, timeout=30, headers=headers)
             response.raise_for_status()  # Raise exception for 4XX/5XX responses
             
         except requests.exceptions.RequestException as e:
@@ -199,12 +349,22 @@ class DataFetcher:
             self.logger.error(error_msg)
             raise RequestError(error_msg) from e
         
+        if response.status_code == 304 and cache_entry is not None:
+            # Data is unchanged on the server, so only the cache TTL needs refreshing
+            self.logger.info("Incidents not modified since last fetch, refreshing cache")
+            self._save_to_cache(cache_entry['data'], cache_entry.get('etag'), cache_entry.get('last_modified'))
+            self._mem_cache = (time.time(), cache_entry['data'])
+            return cache_entry['data']
+        
         try:
-            data = response.json()
+            # Parse the raw body directly rather than via response.json(),
+            # which decodes the whole payload to str first
+            data = json_loads(response.content)
             
-            # Validate that the response has the expected structure
-            if "incidents" not in data:
-                error_msg = "Unexpected API response format: 'incidents' key not found"
+            # Validate that the response has the expected structure in one check,
+            # so the payload can be trusted by everything downstream
+            if not isinstance(data, dict) or not isinstance(data.get('incidents'), list):
+                error_msg = "Unexpected API response format: 'incidents' list not found"
                 self.logger.error(error_msg)
                 raise ParseError(error_msg)
                 
@@ -212,11 +372,31 @@ class DataFetcher:
             
             # Save to cache if caching is enabled
             if use_cache:
-                self._save_to_cache(data)
+                self._save_to_cache(data, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                self._mem_cache = (time.time(), data)
                 
             return data
             
         except ValueError as e:
             error_msg = f"Failed to parse API response as JSON: {str(e)}"
             self.logger.error(error_msg)
-            raise ParseError(error_msg) from e
\ No newline at end of file
+            raise ParseError(error_msg) from e
+    
+    async def fetch_incidents_async(self, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Asynchronous variant of fetch_incidents.
+        
+        The blocking fetch runs in a worker thread, so callers polling several
+        status pages can overlap the network waits with asyncio.gather().
+        
+        Args:
+            use_cache (bool): Whether to use cached data if available. Defaults to True.
+        
+        Returns:
+            dict: Raw incident data from the API or cache
+        
+        Raises:
+            RequestError: If the API request fails
+            ParseError: If the response cannot be parsed
+        """
+        return await asyncio.to_thread(self.fetch_incidents, use_cache)
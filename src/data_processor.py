@@ -6,16 +6,10 @@ It provides functionality to categorize incidents by severity and
 organize them by month for visualization purposes.
 """
 import logging
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
 
 class DataProcessor:
     """
@@ -25,9 +19,7 @@ class DataProcessor:
     and organizing them by month for visualization.
     """
     
-    def __init__(self):
-        """Initialize the DataProcessor."""
-        self.logger = logger
+    logger = logging.getLogger(__name__)
     
     def process_incidents(self, raw_data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
         """
@@ -99,44 +91,68 @@ class DataProcessor:
             ...
         }
         """
+        # Drop incidents missing a required field with cheap membership tests,
+        # rather than handling them as exceptions inside the counting loop
+        valid_incidents = [
+            incident for incident in incidents
+            if 'created_at' in incident and 'impact' in incident
+        ]
+        
+        # Count (month, severity) pairs in one pass, then unflatten the counts
+        # into the documented month -> severity -> count shape
+        pair_counts = Counter(
+            (self._get_month_key(incident['created_at']), incident['impact'])
+            for incident in valid_incidents
+        )
         monthly_data = {}
+        counted = 0
+        for (month_key, severity), count in pair_counts.items():
+            if month_key is not None:
+                monthly_data.setdefault(month_key, {})[severity] = count
+                counted += count
         
-        for incident in incidents:
-            try:
-                # Use the initial creation date for time categorization
-                if 'created_at' not in incident:
-                    self.logger.warning(f"Incident {incident.get('id', 'unknown')} missing 'created_at' field, skipping")
-                    continue
-                
-                # Parse the date and extract the year-month
-                created_date = datetime.fromisoformat(incident['created_at'].replace('Z', '+00:00'))
-                month_key = f"{created_date.year}-{created_date.month:02d}"
-                
-                # Get the severity category
-                severity = self.categorize_by_severity(incident)
-                
-                # Initialize the month entry if it doesn't exist
-                if month_key not in monthly_data:
-                    monthly_data[month_key] = {}
-                
-                # Initialize the severity count if it doesn't exist
-                if severity not in monthly_data[month_key]:
-                    monthly_data[month_key][severity] = 0
-                
-                # Increment the count for this severity in this month
-                monthly_data[month_key][severity] += 1
-                
-            except (ValueError, KeyError) as e:
-                self.logger.warning(f"Error processing incident {incident.get('id', 'unknown')}: {str(e)}")
-                continue
+        if counted < len(incidents):
+            self.logger.warning(
+                "Skipped %d of %d incidents with a missing or invalid 'created_at' or 'impact' field",
+                len(incidents) - counted, len(incidents)
+            )
         
-        # Ensure all months have entries for all severity types
-        self._normalize_severity_categories(monthly_data)
+        # Ensure all months have entries for every severity reported in the feed,
+        # including those of incidents that were skipped above
+        severities = {incident['impact'] for incident in incidents if 'impact' in incident}
+        self._normalize_severity_categories(monthly_data, severities)
         
         self.logger.info(f"Organized incidents by month: {len(monthly_data)} months processed")
         return monthly_data
     
-    def _normalize_severity_categories(self, monthly_data: Dict[str, Dict[str, int]]) -> None:
+    @staticmethod
+    def _get_month_key(created_at: str) -> Optional[str]:
+        """
+        Extract the year-month key from an incident's creation timestamp.
+        
+        Args:
+            created_at (str): The incident's 'created_at' timestamp
+            
+        Returns:
+            Optional[str]: The month as 'YYYY-MM', or None if the timestamp is invalid
+        """
+        # GitHub timestamps are ISO 8601 ('YYYY-MM-DDTHH:MM:SSZ'), so the
+        # year-month is simply the first seven characters, once the year and
+        # month have been checked to be digits and a real month
+        if (len(created_at) >= 10 and created_at[4] == '-' and created_at[7] == '-'
+                and created_at[:4].isdigit() and created_at[5:7].isdigit()
+                and '01' <= created_at[5:7] <= '12'):
+            return created_at[:7]
+        
+        try:
+            # Parse anything else in full and extract the year-month
+            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        return f"{created_date.year}-{created_date.month:02d}"
+    
+    def _normalize_severity_categories(self, monthly_data: Dict[str, Dict[str, int]],
+                                       severities: Optional[Set[str]] = None) -> None:
         """
         Ensure all months have entries for all severity categories.
         
@@ -144,17 +160,17 @@ class DataProcessor:
         
         Args:
             monthly_data (dict): Data organized by month with counts by severity
+            severities (set, optional): Extra severity categories to include even
+                if no month has a count for them
             
         Returns:
             None: The monthly_data dict is modified in place
         """
         # Find all unique severity categories across all months
-        all_severities = set()
-        for month_data in monthly_data.values():
-            all_severities.update(month_data.keys())
+        all_severities = set(severities) if severities else set()
+        all_severities.update(*monthly_data.values())
         
-        # Ensure each month has an entry for each severity category
-        for month_key in monthly_data:
-            for severity in all_severities:
-                if severity not in monthly_data[month_key]:
-                    monthly_data[month_key][severity] = 0
\ No newline at end of file
+        # Fill in only the categories each month is actually missing
+        for month_data in monthly_data.values():
+            for severity in all_severities.difference(month_data):
+                month_data[severity] = 0
\ No newline at end of file
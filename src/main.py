@@ -14,19 +14,6 @@ import sys
 from datetime import datetime
 from typing import Optional, Dict, Any, NoReturn
 
-from data_fetcher import DataFetcher, RequestError, ParseError
-from data_processor import DataProcessor
-from visualizer import Visualizer
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f"github_incidents_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -112,6 +99,12 @@ def parse_arguments() -> argparse.Namespace:
         help="Height of the figure in inches (default: %(default)s)"
     )
     
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Render at half the DPI for a quicker, lower resolution image"
+    )
+    
     return parser.parse_args()
 
 
@@ -119,8 +112,9 @@ def setup_logging(log_level: str) -> None:
     """
     Configure logging with the specified level.
     
-    This function sets the root logger's level based on the provided log_level
-    string. It validates the log level and updates the logger configuration.
+    This function validates the provided log_level string and configures the
+    root logger to write to stdout and to a timestamped log file. The log file
+    is only created once the first record is written to it.
     
     Args:
         log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -132,7 +126,20 @@ def setup_logging(log_level: str) -> None:
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
     
-    # Update the root logger's level
+    logging.basicConfig(
+        level=numeric_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler(
+                f"github_incidents_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+                delay=True
+            )
+        ]
+    )
+    
+    # basicConfig is a no-op if the root logger is already configured,
+    # so always update the root logger's level
     logging.getLogger().setLevel(numeric_level)
     logger.info(f"Logging level set to {log_level}")
 
@@ -151,18 +158,17 @@ def load_cached_data(cache_file: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Cached data if available, None otherwise
     """
-    import json
-    
-    if not os.path.exists(cache_file):
-        logger.info(f"Cache file {cache_file} not found")
-        return None
+    from data_fetcher import json_loads
     
     try:
-        with open(cache_file, 'r') as f:
-            data = json.load(f)
+        with open(cache_file, 'rb') as f:
+            data = json_loads(f.read())
             logger.info(f"Loaded cached data from {cache_file}")
             return data
-    except (json.JSONDecodeError, IOError) as e:
+    except FileNotFoundError:
+        logger.info(f"Cache file {cache_file} not found")
+        return None
+    except (ValueError, IOError) as e:
         logger.warning(f"Failed to load cache file {cache_file}: {str(e)}")
         return None
 
@@ -179,14 +185,16 @@ def save_cached_data(data: Dict[str, Any], cache_file: str) -> None:
         data (Dict[str, Any]): Incident data to cache
         cache_file (str): Path to the cache file
     """
-    import json
+    from data_fetcher import json_dumps
     
     try:
         # Ensure the directory exists
-        os.makedirs(os.path.dirname(cache_file) if os.path.dirname(cache_file) else '.', exist_ok=True)
+        cache_dir = os.path.dirname(cache_file) or '.'
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
         
-        with open(cache_file, 'w') as f:
-            json.dump(data, f)
+        with open(cache_file, 'wb') as f:
+            f.write(json_dumps(data))
             logger.info(f"Cached data saved to {cache_file}")
     except IOError as e:
         logger.warning(f"Failed to save cache file {cache_file}: {str(e)}")
@@ -215,6 +223,12 @@ def main() -> int:
     
     logger.info("Starting GitHub Incident Visualizer")
     
+    # Import the pipeline modules only now, so that --help and argument errors
+    # return without loading requests and matplotlib
+    from data_fetcher import DataFetcher, RequestError, ParseError
+    from data_processor import DataProcessor
+    from visualizer import Visualizer
+    
     try:
         # Initialize components
         data_fetcher = DataFetcher(
@@ -226,7 +240,8 @@ def main() -> int:
         visualizer = Visualizer(
             dpi=args.dpi,
             fig_width=args.fig_width,
-            fig_height=args.fig_height
+            fig_height=args.fig_height,
+            fast=args.fast
         )
         
         # Determine whether to use caching
@@ -1,10 +1,13 @@
 """
 Simple script to test the DataFetcher class.
 """
+import logging
+
 from data_fetcher import DataFetcher
 
 def main():
     """Test the DataFetcher class by fetching incidents from GitHub Status API."""
+    logging.basicConfig(level=logging.INFO)
     fetcher = DataFetcher()
     try:
         data = fetcher.fetch_incidents()
@@ -7,18 +7,47 @@ using matplotlib to generate charts and graphs.
 """
 import logging
 import os
-from typing import Dict, Any, Tuple
-import matplotlib.pyplot as plt
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Optional, Tuple
+import numpy as np
+import matplotlib.style
 import matplotlib.dates as mdates
-from datetime import datetime
 import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# The plot style only needs to be applied to matplotlib's rcParams once
+_style_applied = False
+
+
+def _apply_style() -> None:
+    """Apply the plot style used by all visualizations, once per process."""
+    global _style_applied
+    if not _style_applied:
+        # Use a matplotlib style for a more modern and readable appearance
+        matplotlib.style.use('seaborn-v0_8-whitegrid')
+        _style_applied = True
+
+
+def _render_one(job: Tuple[Dict[str, Dict[str, int]], str, Dict[str, Any]]) -> str:
+    """
+    Render a single chart in a worker process for Visualizer.generate_many.
+    
+    Args:
+        job (tuple): (processed_data, output_path, params), where params are
+            keyword arguments for the Visualizer constructor
+            
+    Returns:
+        str: The path the chart was saved to
+    """
+    processed_data, output_path, params = job
+    visualizer = Visualizer(**params)
+    try:
+        visualizer.generate_visualization(processed_data, output_path)
+    finally:
+        visualizer.close()
+    return output_path
 
 class Visualizer:
     """
@@ -28,7 +57,28 @@ class Visualizer:
     incidents by severity over time.
     """
     
-    def __init__(self, dpi: int = 150, fig_width: int = 12, fig_height: int = 8):
+    logger = logging.getLogger(__name__)
+    
+    # Stacking order of the known severity types, from the bottom of the stack up
+    _SEVERITY_RANK = {
+        severity: rank
+        for rank, severity in enumerate(['critical', 'major', 'minor', 'maintenance', 'none'])
+    }
+    
+    # Up to this many months get one static tick per month; longer ranges fall
+    # back to matplotlib's date locator so the axis doesn't get overcrowded
+    _STATIC_TICK_LIMIT = 24
+    
+    # Space around the axes, in inches, for the title, the y-axis label, the
+    # rotated month labels with the x-axis label and the total annotation.
+    # Text is sized in points, so this stays the same whatever the figure size.
+    _MARGINS_INCHES = {'left': 0.85, 'right': 0.25, 'top': 0.65, 'bottom': 1.05}
+    
+    # On very small figures the margins are shrunk so that together they take
+    # at most this share of the width or height, leaving room for the axes
+    _MAX_MARGIN_SHARE = 0.5
+    
+    def __init__(self, dpi: int = 150, fig_width: int = 12, fig_height: int = 8, fast: bool = False):
         """
         Initialize the Visualizer with customizable visualization parameters.
         
@@ -36,9 +86,12 @@ class Visualizer:
             dpi (int): Dots per inch for the output image. Higher values result in larger, more detailed images.
             fig_width (int): Width of the figure in inches.
             fig_height (int): Height of the figure in inches.
+            fast (bool): Render at half the requested DPI (but at least 72). Rendering and PNG
+                compression time scale with the pixel count, so this is roughly 4x less work,
+                at the cost of a lower resolution image.
         """
-        self.logger = logger
-        self.dpi = dpi
+        self.dpi = max(72, dpi // 2) if fast else dpi
+        self.fast = fast
         self.fig_width = fig_width
         self.fig_height = fig_height
         
@@ -52,6 +105,92 @@ class Visualizer:
             'critical': '#9D0208',   # Dark red - very serious issues
         }
         
+        # Colors generated for severities not in the color map, by name
+        self._color_cache: Dict[str, Tuple[float, float, float]] = {}
+        
+        # The figure and axes are created on first use and reused by later
+        # renders, which is much cheaper than building a new figure each time
+        self._fig = None
+        self._ax = None
+    
+    def close(self) -> None:
+        """Release the reusable figure and its render buffers."""
+        self._fig = None
+        self._ax = None
+    
+    @classmethod
+    def generate_many(
+        cls,
+        jobs: Iterable[Tuple[Dict[str, Dict[str, int]], str, Dict[str, Any]]],
+        workers: Optional[int] = None
+    ) -> None:
+        """
+        Generate several PNG visualizations in parallel worker processes.
+        
+        Rasterization and PNG compression are CPU-bound, so independent charts
+        are rendered in separate processes rather than one after another.
+        
+        Args:
+            jobs (iterable): (processed_data, output_path, params) tuples, where params
+                are keyword arguments for the Visualizer constructor
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            
+        Returns:
+            None
+            
+        Raises:
+            ValueError: If any job's processed_data is empty or not in the expected format
+            IOError: If there's an issue saving any of the images
+        """
+        with ProcessPoolExecutor(workers) as executor:
+            for output_path in executor.map(_render_one, jobs):
+                cls.logger.info(f"Rendered {output_path}")
+    
+    def _get_axes(self):
+        """
+        Get a cleared figure and axes to draw on, creating them on first use.
+        
+        Returns:
+            Tuple[Figure, Axes]: The reusable figure and its axes
+        """
+        if self._fig is None:
+            _apply_style()
+            # Draw straight onto an Agg canvas: PNG export needs no GUI backend,
+            # and bypassing pyplot skips its global figure-manager bookkeeping
+            self._fig = Figure(figsize=(self.fig_width, self.fig_height), dpi=self.dpi)
+            FigureCanvasAgg(self._fig)
+            # The chart's layout is the same on every render, so fixed margins
+            # replace a tight_layout pass that re-measures every artist each time.
+            # subplots_adjust takes fractions of the figure, so convert from inches.
+            margins = self._MARGINS_INCHES
+            left, right = self._margin_fractions(margins['left'], margins['right'], self.fig_width)
+            bottom, top = self._margin_fractions(margins['bottom'], margins['top'], self.fig_height)
+            self._fig.subplots_adjust(left=left, right=1 - right, top=1 - top, bottom=bottom)
+            self._ax = self._fig.add_subplot(111)
+        else:
+            # Remove the previous render's artists, including the figure-level text
+            self._ax.clear()
+            for text in list(self._fig.texts):
+                text.remove()
+        return self._fig, self._ax
+    
+    def _margin_fractions(self, before: float, after: float, size: float) -> Tuple[float, float]:
+        """
+        Convert a pair of opposite margins from inches to fractions of the figure.
+        
+        Args:
+            before (float): Left or bottom margin in inches
+            after (float): Right or top margin in inches
+            size (float): Figure width or height in inches
+            
+        Returns:
+            Tuple[float, float]: The two margins as fractions of the figure size,
+                scaled down together if they would leave too little room for the axes
+        """
+        share = (before + after) / size
+        scale = min(1.0, self._MAX_MARGIN_SHARE / share)
+        return before / size * scale, after / size * scale
+    
     def generate_visualization(self, processed_data: Dict[str, Dict[str, int]], output_path: str) -> None:
         """
         Generate a PNG visualization of incidents by severity over time.
@@ -75,11 +214,8 @@ class Visualizer:
         self.logger.info(f"Generating visualization with {len(processed_data)} months of data")
         
         try:
-            # Use plt.style for a more modern and readable appearance
-            plt.style.use('seaborn-v0_8-whitegrid')
-            
-            # Create a new figure with appropriate size and resolution
-            plt.figure(figsize=(self.fig_width, self.fig_height), dpi=self.dpi)
+            # Get a figure with appropriate size and resolution
+            fig, ax = self._get_axes()
             
             # Sort months chronologically
             sorted_months = sorted(processed_data.keys())
@@ -89,69 +225,79 @@ class Visualizer:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
                 
-            # Convert month strings to datetime objects for better x-axis formatting
-            x_dates = [datetime.strptime(month, "%Y-%m") for month in sorted_months]
+            # Convert month strings to dates for better x-axis formatting. NumPy
+            # parses 'YYYY-MM' natively as a month, in one vectorized pass.
+            x_dates = np.array(sorted_months, dtype='datetime64[M]').astype('datetime64[D]')
             
             # Get all unique severity types across all months
-            all_severities = set()
-            for month_data in processed_data.values():
-                all_severities.update(month_data.keys())
+            all_severities = set().union(*processed_data.values())
             
             # Sort severities by importance for better visual hierarchy
             # This ensures critical/major incidents are at the bottom of the stack and more visible
-            severity_order = ['critical', 'major', 'minor', 'maintenance', 'none']
-            sorted_severities = sorted(
-                all_severities,
-                key=lambda x: severity_order.index(x) if x in severity_order else 999
+            sorted_severities = sorted(all_severities, key=lambda x: self._SEVERITY_RANK.get(x, 999))
+            
+            # Build a (severity x month) matrix of counts once, so that stacking
+            # and totals are computed by NumPy rather than per-layer Python loops
+            counts = np.array(
+                [[processed_data[month].get(severity, 0) for month in sorted_months]
+                 for severity in sorted_severities],
+                dtype=np.int64
             )
             
-            # Create a stacked bar chart
-            bottom = [0] * len(sorted_months)
-            bars = []
+            # Each layer of the stack starts where the layers below it end
+            bottoms = np.cumsum(counts, axis=0) - counts
             
-            # Plot each severity type as a layer in the stack
-            for severity in sorted_severities:
-                # Extract counts for this severity across all months
-                counts = [processed_data[month].get(severity, 0) for month in sorted_months]
-                
-                # Get color for this severity, or generate one if not in our map
-                color = self.color_map.get(severity, self._get_color_for_severity(severity))
-                
+            # Get the color for each severity, generating one only if it's not in our map
+            colors = [
+                self.color_map.get(severity) or self._get_color_for_severity(severity)
+                for severity in sorted_severities
+            ]
+            
+            # Create a stacked bar chart, plotting each severity type as a layer in the stack
+            bars = []
+            for i, severity in enumerate(sorted_severities):
                 # Plot this severity layer with improved styling
-                bar = plt.bar(
+                bar = ax.bar(
                     x_dates, 
-                    counts, 
-                    bottom=bottom, 
+                    counts[i], 
+                    bottom=bottoms[i], 
                     label=severity.capitalize(), 
-                    color=color,
+                    color=colors[i],
                     edgecolor='white',  # Add white edges for better separation
                     linewidth=0.5,      # Thin edge lines
                     alpha=0.9           # Slight transparency for better layering
                 )
                 bars.append(bar)
-                
-                # Update the bottom values for the next layer
-                bottom = [b + c for b, c in zip(bottom, counts)]
             
-            # Configure the x-axis to show months nicely
-            ax = plt.gca()
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-            plt.xticks(rotation=45, ha='right')  # Improved readability with right alignment
+            # Configure the x-axis to show months nicely. For short ranges the
+            # tick positions and labels are set directly, which skips the date
+            # locator and formatter callbacks on every draw.
+            if len(sorted_months) <= self._STATIC_TICK_LIMIT:
+                ax.set_xticks(x_dates)
+                ax.set_xticklabels(
+                    [month.strftime('%b %Y') for month in x_dates.tolist()],
+                    rotation=45,
+                    ha='right'  # Improved readability with right alignment
+                )
+            else:
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+                ax.xaxis.set_major_locator(mdates.MonthLocator())
+                for label in ax.get_xticklabels():
+                    label.set(rotation=45, ha='right')  # Improved readability with right alignment
             
             # Add grid lines for better readability of values
             ax.yaxis.grid(True, linestyle='--', alpha=0.7)
             
             # Add data labels for better readability
-            self._add_data_labels(bars, x_dates, processed_data, sorted_months, sorted_severities)
+            self._add_data_labels(bars, counts)
             
             # Add labels and title with improved styling
-            plt.xlabel('Month', fontsize=12, fontweight='bold')
-            plt.ylabel('Number of Incidents', fontsize=12, fontweight='bold')
-            plt.title('GitHub Incidents by Severity Over Time', fontsize=16, fontweight='bold', pad=20)
+            ax.set_xlabel('Month', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Number of Incidents', fontsize=12, fontweight='bold')
+            ax.set_title('GitHub Incidents by Severity Over Time', fontsize=16, fontweight='bold', pad=20)
             
             # Add a legend with improved positioning and styling
-            legend = plt.legend(
+            legend = ax.legend(
                 title='Severity',
                 title_fontsize=12,
                 fontsize=10,
@@ -162,83 +308,75 @@ class Visualizer:
             )
             
             # Add a text annotation with the total number of incidents
-            total_incidents = sum(sum(month_data.values()) for month_data in processed_data.values())
-            plt.figtext(
+            total_incidents = int(counts.sum())
+            fig.text(
                 0.02, 0.02, 
                 f'Total incidents: {total_incidents}', 
                 fontsize=9, 
                 style='italic'
             )
             
-            # Adjust layout to make room for the rotated x-axis labels and annotations
-            plt.tight_layout()
+            # Ensure the output directory exists, skipping makedirs when it already does
+            output_dir = os.path.dirname(output_path) or '.'
+            if not os.path.isdir(output_dir):
+                os.makedirs(output_dir, exist_ok=True)
             
-            # Ensure the output directory exists
-            os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-            
-            # Save the figure with optimized settings
-            plt.savefig(
+            # Save the figure with fast PNG compression. The margins are fixed when
+            # the figure is created, so bbox_inches='tight' would only add a second
+            # render pass to measure it.
+            fig.savefig(
                 output_path, 
                 format='png',
                 dpi=self.dpi,
-                bbox_inches='tight'  # Trim extra whitespace
+                pil_kwargs={'optimize': False, 'compress_level': 1}
             )
             self.logger.info(f"Visualization saved to {output_path}")
             
-            # Close the figure to free memory
-            plt.close()
-            
         except Exception as e:
             error_msg = f"Error generating visualization: {str(e)}"
             self.logger.error(error_msg)
             raise
     
-    def _add_data_labels(self, bars, x_dates, processed_data, sorted_months, sorted_severities):
+    def _add_data_labels(self, bars, counts):
         """
         Add data labels to the bars for better readability.
         
         This method adds count labels to bars that are large enough to be significant.
         
         Args:
-            bars: List of bar container objects from plt.bar()
-            x_dates: List of datetime objects for the x-axis
-            processed_data: The processed incident data
-            sorted_months: List of sorted month strings
-            sorted_severities: List of sorted severity types
+            bars: BarContainer for each severity layer, in stacking order
+            counts: (severity x month) array of incident counts
         """
-        # Calculate the total height of each stack
-        totals = [sum(processed_data[month].values()) for month in sorted_months]
-        max_total = max(totals) if totals else 0
+        # Calculate the total height of each stack; nothing to label if every stack is empty
+        totals = counts.sum(axis=0)
+        max_total = totals.max(initial=0)
+        if max_total == 0:
+            return
         
         # Only add labels to bars that are significant enough (at least 10% of the max height)
         threshold = max_total * 0.1
         
-        for i, severity in enumerate(sorted_severities):
-            for j, month in enumerate(sorted_months):
-                count = processed_data[month].get(severity, 0)
-                if count >= threshold:  # Only label significant bars
-                    # Get the y position (middle of the bar)
-                    height = bars[i][j].get_height()
-                    y_pos = bars[i][j].get_y() + height / 2
-                    
-                    # Add the label
-                    plt.text(
-                        x_dates[j], y_pos,
-                        str(count),
-                        ha='center',
-                        va='center',
-                        fontsize=9,
-                        fontweight='bold',
-                        color='white'
-                    )
-            
+        # Label the middle of each significant bar, one call per severity layer;
+        # an empty label leaves a bar that's too small unlabelled
+        significant = counts >= threshold
+        for container, layer_counts, layer_significant in zip(bars, counts, significant):
+            self._ax.bar_label(
+                container,
+                labels=[str(c) if keep else '' for c, keep in zip(layer_counts, layer_significant)],
+                label_type='center',
+                fontsize=9,
+                fontweight='bold',
+                color='white'
+            )
+    
     def _get_color_for_severity(self, severity: str) -> Tuple[float, float, float]:
         """
         Generate a color for a severity type not in the predefined color map.
         
         This method creates a consistent color based on the severity name
         for any severity types not included in the predefined color map.
-        The colors are chosen to be distinguishable and accessible.
+        The colors are chosen to be distinguishable and accessible, and are
+        only computed once per severity.
         
         Args:
             severity (str): The severity type name
@@ -246,14 +384,20 @@ class Visualizer:
         Returns:
             Tuple[float, float, float]: An RGB color tuple
         """
-        # Use a hash of the severity name to generate a consistent color
-        # We use a different approach to ensure better color separation
-        severity_hash = hash(severity) % 1000 / 1000.0
+        color = self._color_cache.get(severity)
+        if color is not None:
+            return color
+        
+        # Use a CRC32 of the severity name to generate a consistent color. Unlike
+        # hash(), which is salted per process, this is stable across runs.
+        severity_hash = zlib.crc32(severity.encode('utf-8'))
         
         # Use a color palette that's more accessible and distinguishable
-        # Adjust saturation and value for better visibility
-        hue = severity_hash
-        saturation = 0.7 + (hash(severity) % 300) / 1000.0  # Range: 0.7-0.999
-        value = 0.8 + (hash(severity[::-1]) % 200) / 1000.0  # Range: 0.8-0.999
+        # Take hue, saturation and value from separate bits of the one hash
+        hue = (severity_hash & 0x3FF) / 1024.0
+        saturation = 0.7 + ((severity_hash >> 10) & 0xFF) / 1024.0  # Range: 0.7-0.949
+        value = 0.8 + ((severity_hash >> 18) & 0xFF) / 1280.0  # Range: 0.8-0.999
         
-        return mcolors.hsv_to_rgb([hue, saturation, value])
\ No newline at end of file
+        color = tuple(float(c) for c in mcolors.hsv_to_rgb([hue, saturation, value]))
+        self._color_cache[severity] = color
+        return color
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Shared pytest configuration for the GitHub Incident Visualizer tests.
+"""
+import sys
+from pathlib import Path
+
+import matplotlib
+
+# Make the application modules importable by their own names, the way main.py
+# imports them, so each module is only ever loaded once per session
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Select the non-interactive backend before any test imports pyplot, so the
+# suite never loads a GUI toolkit and runs the same way on headless CI
+matplotlib.use("Agg", force=True)
+
@@ -1,12 +1,39 @@
 """
 Unit tests for the DataFetcher class.
 """
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 import json
+import shutil
+import tempfile
 import requests
 
-from src.data_fetcher import DataFetcher, RequestError, ParseError
+import data_fetcher
+from data_fetcher import DataFetcher, RequestError, ParseError
+
+
+# Sample valid response data, shared by all tests. Tests must not mutate it;
+# take a copy.deepcopy first if a test needs to change it.
+VALID_DATA_FETCHER_RESPONSE = {
+    "page": {
+        "id": "kctbh9vrtdwd",
+        "name": "GitHub",
+        "url": "https://www.githubstatus.com",
+        "updated_at": "2023-01-01T00:00:00Z"
+    },
+    "incidents": [
+        {
+            "id": "test-incident-1",
+            "name": "Test Incident 1",
+            "status": "resolved",
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-01-01T01:00:00Z",
+            "impact": "minor",
+            "incident_updates": []
+        }
+    ]
+}
 
 
 class TestDataFetcher(unittest.TestCase):
@@ -14,40 +41,27 @@ class TestDataFetcher(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.data_fetcher = DataFetcher()
-        
-        # Sample valid response data
-        self.valid_response_data = {
-            "page": {
-                "id": "kctbh9vrtdwd",
-                "name": "GitHub",
-                "url": "https://www.githubstatus.com",
-                "updated_at": "2023-01-01T00:00:00Z"
-            },
-            "incidents": [
-                {
-                    "id": "test-incident-1",
-                    "name": "Test Incident 1",
-                    "status": "resolved",
-                    "created_at": "2023-01-01T00:00:00Z",
-                    "updated_at": "2023-01-01T01:00:00Z",
-                    "impact": "minor",
-                    "incident_updates": []
-                }
-            ]
-        }
+        # Use a throwaway cache directory so tests don't see each other's cache
+        self.cache_dir = tempfile.mkdtemp()
+        self.data_fetcher = DataFetcher(cache_dir=self.cache_dir)
+        
+        self.valid_response_data = VALID_DATA_FETCHER_RESPONSE
 
-    @patch('requests.get')
-    def test_successful_data_retrieval(self, mock_get):
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_successful_data_retrieval(self):
         """Test that incidents are successfully retrieved and parsed."""
         # Configure the mock to return a successful response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = self.valid_response_data
-        mock_get.return_value = mock_response
+        mock_response.content = json.dumps(self.valid_response_data).encode()
+        mock_response.headers = {}
         
-        # Call the method under test
-        result = self.data_fetcher.fetch_incidents()
+        # Call the method under test, through the fetcher's own pooled session
+        with patch.object(self.data_fetcher._session, 'get', return_value=mock_response) as mock_get:
+            result = self.data_fetcher.fetch_incidents()
         
         # Verify the result
         self.assertEqual(result, self.valid_response_data)
@@ -55,9 +69,105 @@ class TestDataFetcher(unittest.TestCase):
         self.assertEqual(result['incidents'][0]['id'], 'test-incident-1')
         
         # Verify the mock was called with the correct URL
-        mock_get.assert_called_once_with(self.data_fetcher.api_url, timeout=30)
+        mock_get.assert_called_once_with(self.data_fetcher.api_url, timeout=30, headers={})
+
+    @patch('requests.Session.get')
+    def test_repeat_fetch_uses_in_memory_cache(self, mock_get):
+        """Test that a second fetch in the same process doesn't hit the API or the cache file."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(self.valid_response_data).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        first = self.data_fetcher.fetch_incidents()
+        with patch.object(self.data_fetcher, '_load_from_cache') as mock_load:
+            second = self.data_fetcher.fetch_incidents()
+        
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        mock_load.assert_not_called()
+
+    def test_cache_round_trip_without_msgpack(self):
+        """Test that the cache falls back to JSON files when msgpack isn't installed."""
+        with patch('data_fetcher.msgpack', None):
+            data_fetcher = DataFetcher(cache_dir=self.cache_dir)
+            self.assertTrue(data_fetcher._get_cache_path().endswith('.json'))
+            
+            self.assertTrue(data_fetcher._save_to_cache(self.valid_response_data))
+            cache_entry, cache_fresh = data_fetcher._load_from_cache()
+        
+        self.assertTrue(cache_fresh)
+        self.assertEqual(cache_entry['data'], self.valid_response_data)
+
+    @unittest.skipIf(data_fetcher.msgpack is None, "msgpack is not installed")
+    def test_legacy_json_cache_is_read_with_msgpack_installed(self):
+        """Test that a JSON cache written without msgpack is still used once msgpack is installed."""
+        with patch('data_fetcher.msgpack', None):
+            DataFetcher(cache_dir=self.cache_dir)._save_to_cache(self.valid_response_data)
+        
+        self.assertTrue(self.data_fetcher._get_cache_path().endswith('.msgpack'))
+        cache_entry, cache_fresh = self.data_fetcher._load_from_cache()
+        
+        self.assertTrue(cache_fresh)
+        self.assertEqual(cache_entry['data'], self.valid_response_data)
 
-    @patch('requests.get')
+    def test_session_requests_compressed_responses(self):
+        """Test that the session asks the API for a compressed body."""
+        self.assertIn('gzip', self.data_fetcher._session.headers['Accept-Encoding'])
+
+    def test_shared_session_is_not_closed_by_fetcher(self):
+        """Test that fetchers can share a session without closing it for each other."""
+        session = MagicMock()
+        first = DataFetcher(cache_dir=self.cache_dir, session=session)
+        second = DataFetcher(api_url="https://example.com/api/v2/incidents.json",
+                             cache_dir=self.cache_dir, session=session)
+        
+        self.assertIs(first._session, second._session)
+        first.close()
+        session.close.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_fetch_incidents_async(self, mock_get):
+        """Test that the async variant returns the same data as the sync fetch."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(self.valid_response_data).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        result = asyncio.run(self.data_fetcher.fetch_incidents_async())
+        
+        self.assertEqual(result, self.valid_response_data)
+        mock_get.assert_called_once_with(self.data_fetcher.api_url, timeout=30, headers={})
+
+    @patch('requests.Session.get')
+    def test_not_modified_response_uses_cached_data(self, mock_get):
+        """Test that an expired cache entry is revalidated with a conditional request."""
+        # Write an expired cache entry with validators
+        self.data_fetcher.cache_ttl = 0
+        self.data_fetcher._save_to_cache(self.valid_response_data, '"abc123"', 'Sun, 01 Jan 2023 01:00:00 GMT')
+        
+        # Configure the mock to return 304 Not Modified with an empty body
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_response.content = b""
+        mock_get.return_value = mock_response
+        
+        result = self.data_fetcher.fetch_incidents()
+        
+        # The cached data is returned and the validators were sent
+        self.assertEqual(result, self.valid_response_data)
+        mock_get.assert_called_once_with(
+            self.data_fetcher.api_url,
+            timeout=30,
+            headers={
+                'If-None-Match': '"abc123"',
+                'If-Modified-Since': 'Sun, 01 Jan 2023 01:00:00 GMT'
+            }
+        )
+
+    @patch('requests.Session.get')
     def test_http_error_handling(self, mock_get):
         """Test handling of HTTP errors."""
         # Configure the mock to raise an HTTP error
@@ -67,7 +177,7 @@ class TestDataFetcher(unittest.TestCase):
         with self.assertRaises(RequestError):
             self.data_fetcher.fetch_incidents()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_connection_error_handling(self, mock_get):
         """Test handling of connection errors."""
         # Configure the mock to raise a connection error
@@ -77,7 +187,7 @@ class TestDataFetcher(unittest.TestCase):
         with self.assertRaises(RequestError):
             self.data_fetcher.fetch_incidents()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_timeout_error_handling(self, mock_get):
         """Test handling of timeout errors."""
         # Configure the mock to raise a timeout error
@@ -87,32 +197,46 @@ class TestDataFetcher(unittest.TestCase):
         with self.assertRaises(RequestError):
             self.data_fetcher.fetch_incidents()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_json_parse_error_handling(self, mock_get):
         """Test handling of JSON parsing errors."""
         # Configure the mock to return an invalid JSON response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
         mock_get.return_value = mock_response
         
         # Verify that the method raises a ParseError
         with self.assertRaises(ParseError):
             self.data_fetcher.fetch_incidents()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_unexpected_response_format_handling(self, mock_get):
         """Test handling of unexpected API response format."""
         # Configure the mock to return a response without the 'incidents' key
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"page": {"id": "kctbh9vrtdwd"}}  # Missing 'incidents' key
+        mock_response.content = b'{"page": {"id": "kctbh9vrtdwd"}}'  # Missing 'incidents' key
         mock_get.return_value = mock_response
         
         # Verify that the method raises a ParseError
         with self.assertRaises(ParseError):
             self.data_fetcher.fetch_incidents()
 
+    @patch('requests.Session.get')
+    def test_non_object_response_handling(self, mock_get):
+        """Test handling of valid JSON responses that aren't an incidents object."""
+        for content in (b'123', b'{"incidents": null}'):
+            with self.subTest(content=content):
+                mock_response = MagicMock()
+                mock_response.status_code = 200
+                mock_response.content = content
+                mock_get.return_value = mock_response
+                
+                # Verify that the method raises a ParseError
+                with self.assertRaises(ParseError):
+                    self.data_fetcher.fetch_incidents(use_cache=False)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,7 +3,57 @@ Unit tests for the DataProcessor class.
 """
 import unittest
 from datetime import datetime
-from src.data_processor import DataProcessor
+from data_processor import DataProcessor
+
+
+# Sample valid response data, shared by all tests. Tests must not mutate it;
+# take a copy.deepcopy first if a test needs to change it.
+VALID_PROCESSOR_RESPONSE = {
+    "page": {
+        "id": "kctbh9vrtdwd",
+        "name": "GitHub",
+        "url": "https://www.githubstatus.com",
+        "updated_at": "2023-01-01T00:00:00Z"
+    },
+    "incidents": [
+        {
+            "id": "incident-1",
+            "name": "Major Incident",
+            "status": "resolved",
+            "created_at": "2025-01-15T00:00:00Z",
+            "updated_at": "2025-01-15T01:00:00Z",
+            "impact": "major",
+            "incident_updates": []
+        },
+        {
+            "id": "incident-2",
+            "name": "Minor Incident",
+            "status": "resolved",
+            "created_at": "2025-01-20T00:00:00Z",
+            "updated_at": "2025-01-20T01:00:00Z",
+            "impact": "minor",
+            "incident_updates": []
+        },
+        {
+            "id": "incident-3",
+            "name": "Another Minor Incident",
+            "status": "resolved",
+            "created_at": "2025-02-05T00:00:00Z",
+            "updated_at": "2025-02-05T01:00:00Z",
+            "impact": "minor",
+            "incident_updates": []
+        },
+        {
+            "id": "incident-4",
+            "name": "No Impact Incident",
+            "status": "resolved",
+            "created_at": "2025-02-10T00:00:00Z",
+            "updated_at": "2025-02-10T01:00:00Z",
+            "impact": "none",
+            "incident_updates": []
+        }
+    ]
+}
 
 
 class TestDataProcessor(unittest.TestCase):
@@ -13,76 +63,18 @@ class TestDataProcessor(unittest.TestCase):
         """Set up test fixtures."""
         self.data_processor = DataProcessor()
         
-        # Sample valid response data
-        self.valid_response_data = {
-            "page": {
-                "id": "kctbh9vrtdwd",
-                "name": "GitHub",
-                "url": "https://www.githubstatus.com",
-                "updated_at": "2023-01-01T00:00:00Z"
-            },
-            "incidents": [
-                {
-                    "id": "incident-1",
-                    "name": "Major Incident",
-                    "status": "resolved",
-                    "created_at": "2025-01-15T00:00:00Z",
-                    "updated_at": "2025-01-15T01:00:00Z",
-                    "impact": "major",
-                    "incident_updates": []
-                },
-                {
-                    "id": "incident-2",
-                    "name": "Minor Incident",
-                    "status": "resolved",
-                    "created_at": "2025-01-20T00:00:00Z",
-                    "updated_at": "2025-01-20T01:00:00Z",
-                    "impact": "minor",
-                    "incident_updates": []
-                },
-                {
-                    "id": "incident-3",
-                    "name": "Another Minor Incident",
-                    "status": "resolved",
-                    "created_at": "2025-02-05T00:00:00Z",
-                    "updated_at": "2025-02-05T01:00:00Z",
-                    "impact": "minor",
-                    "incident_updates": []
-                },
-                {
-                    "id": "incident-4",
-                    "name": "No Impact Incident",
-                    "status": "resolved",
-                    "created_at": "2025-02-10T00:00:00Z",
-                    "updated_at": "2025-02-10T01:00:00Z",
-                    "impact": "none",
-                    "incident_updates": []
-                }
-            ]
-        }
+        self.valid_response_data = VALID_PROCESSOR_RESPONSE
 
     def test_categorize_by_severity(self):
         """Test that incidents are correctly categorized by severity."""
-        # Test major incident
-        major_incident = {
-            "id": "test-incident-1",
-            "impact": "major"
-        }
-        self.assertEqual(self.data_processor.categorize_by_severity(major_incident), "major")
-        
-        # Test minor incident
-        minor_incident = {
-            "id": "test-incident-2",
-            "impact": "minor"
-        }
-        self.assertEqual(self.data_processor.categorize_by_severity(minor_incident), "minor")
-        
-        # Test none impact incident
-        none_incident = {
-            "id": "test-incident-3",
-            "impact": "none"
-        }
-        self.assertEqual(self.data_processor.categorize_by_severity(none_incident), "none")
+        # Each impact level is reported as its own severity
+        for impact in ("major", "minor", "none"):
+            with self.subTest(impact=impact):
+                incident = {
+                    "id": f"test-incident-{impact}",
+                    "impact": impact
+                }
+                self.assertEqual(self.data_processor.categorize_by_severity(incident), impact)
 
     def test_categorize_by_severity_invalid_incident(self):
         """Test handling of invalid incidents without impact field."""
@@ -179,13 +171,25 @@ class TestDataProcessor(unittest.TestCase):
                 "name": "Invalid Date Format",
                 "created_at": "not-a-date",  # Invalid date format
                 "impact": "minor"
+            },
+            {
+                "id": "incident-3",
+                "name": "Month Out Of Range",
+                "created_at": "2025-13-01T00:00:00Z",  # ISO-shaped, but no 13th month
+                "impact": "minor"
+            },
+            {
+                "id": "incident-4",
+                "name": "Non-Numeric Date",
+                "created_at": "abcd-ef-ghT00:00:00Z",  # ISO-shaped, but not digits
+                "impact": "minor"
             }
         ]
         
         result = self.data_processor.organize_by_month(incidents)
         
         # Only the valid incident should be processed
-        self.assertIn("2025-01", result)
+        self.assertEqual(list(result), ["2025-01"])
         self.assertEqual(result["2025-01"]["major"], 1)
         self.assertEqual(result["2025-01"]["minor"], 0)  # Normalized by _normalize_severity_categories
 
@@ -2,40 +2,84 @@
 Unit tests for the Visualizer module.
 """
 import os
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
-import matplotlib.pyplot as plt
-from src.visualizer import Visualizer
+from matplotlib.axes import Axes
+from visualizer import Visualizer
+
+# Sample processed data with multiple months and severity types
+SAMPLE_DATA = {
+    "2025-01": {"major": 3, "minor": 5, "none": 1},
+    "2025-02": {"major": 1, "minor": 2, "none": 0},
+    "2025-03": {"major": 0, "minor": 4, "none": 2, "maintenance": 1}
+}
+
+# Single month data
+SINGLE_MONTH_DATA = {
+    "2025-01": {"major": 3, "minor": 5, "none": 1}
+}
+
+# Single severity data
+SINGLE_SEVERITY_DATA = {
+    "2025-01": {"major": 3},
+    "2025-02": {"major": 1},
+    "2025-03": {"major": 2}
+}
+
+
+@pytest.fixture(scope="module")
+def visualizer():
+    """A Visualizer shared by the tests in this module."""
+    visualizer = Visualizer()
+    yield visualizer
+    visualizer.close()
+
+
+@pytest.fixture
+def sample_np():
+    """SAMPLE_DATA as (months, severities, counts) arrays, severities in stacking order."""
+    months = np.array(["2025-01", "2025-02", "2025-03"])
+    severities = np.array(["major", "minor", "maintenance", "none"])
+    counts = np.array([[3, 1, 0], [5, 2, 4], [0, 0, 1], [1, 0, 2]], dtype=np.int64)
+    return months, severities, counts
+
 
 class TestVisualizer:
     """Test cases for the Visualizer class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, visualizer):
         """Set up test fixtures."""
-        self.visualizer = Visualizer()
+        # Reuse the shared visualizer, forgetting any colors earlier tests generated
+        self.visualizer = visualizer
+        self.visualizer._color_cache.clear()
         self.test_output_path = "test_visualization.png"
         
-        # Sample processed data with multiple months and severity types
-        self.sample_data = {
-            "2025-01": {"major": 3, "minor": 5, "none": 1},
-            "2025-02": {"major": 1, "minor": 2, "none": 0},
-            "2025-03": {"major": 0, "minor": 4, "none": 2, "maintenance": 1}
-        }
+        self.sample_data = SAMPLE_DATA
+        
+        yield
         
-    def teardown_method(self):
-        """Clean up after tests."""
         # Remove test output file if it exists
         if os.path.exists(self.test_output_path):
             os.remove(self.test_output_path)
     
-    @patch("matplotlib.pyplot.savefig")
-    def test_generate_visualization_with_valid_data(self, mock_savefig):
-        """Test visualization generation with valid data."""
+    @pytest.mark.parametrize(
+        "data",
+        [SAMPLE_DATA, SINGLE_MONTH_DATA, SINGLE_SEVERITY_DATA],
+        ids=["multi", "one_month", "one_severity"]
+    )
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_generate_visualization(self, mock_savefig, data):
+        """Test visualization generation with valid data of different shapes."""
         # Call the method
-        self.visualizer.generate_visualization(self.sample_data, self.test_output_path)
+        self.visualizer.generate_visualization(data, self.test_output_path)
         
         # Check that savefig was called with the correct path
-        mock_savefig.assert_called_once_with(self.test_output_path, format='png')
+        mock_savefig.assert_called_once_with(
+            self.test_output_path, format='png', dpi=150,
+            pil_kwargs={'optimize': False, 'compress_level': 1}
+        )
     
     def test_generate_visualization_with_empty_data(self):
         """Test visualization generation with empty data."""
@@ -43,66 +87,113 @@ class TestVisualizer:
         with pytest.raises(ValueError, match="No data provided"):
             self.visualizer.generate_visualization({}, self.test_output_path)
     
-    @patch("matplotlib.pyplot.savefig")
-    def test_generate_visualization_with_single_month(self, mock_savefig):
-        """Test visualization generation with a single month of data."""
-        # Single month data
-        single_month_data = {
-            "2025-01": {"major": 3, "minor": 5, "none": 1}
-        }
-        
-        # Call the method
-        self.visualizer.generate_visualization(single_month_data, self.test_output_path)
-        
-        # Check that savefig was called with the correct path
-        mock_savefig.assert_called_once_with(self.test_output_path, format='png')
-    
-    @patch("matplotlib.pyplot.savefig")
-    def test_generate_visualization_with_single_severity(self, mock_savefig):
-        """Test visualization generation with a single severity type."""
-        # Single severity data
-        single_severity_data = {
-            "2025-01": {"major": 3},
-            "2025-02": {"major": 1},
-            "2025-03": {"major": 2}
-        }
-        
-        # Call the method
-        self.visualizer.generate_visualization(single_severity_data, self.test_output_path)
-        
-        # Check that savefig was called with the correct path
-        mock_savefig.assert_called_once_with(self.test_output_path, format='png')
-    
-    @patch("matplotlib.pyplot.savefig", side_effect=IOError("Permission denied"))
+    @patch("matplotlib.figure.Figure.savefig", side_effect=IOError("Permission denied"))
     def test_generate_visualization_with_io_error(self, mock_savefig):
         """Test handling of IO errors when saving the visualization."""
         # Call the method and expect an exception
         with pytest.raises(IOError):
-            self.visualizer.generate_visualization(self.sample_data, "/invalid/path/test.png")
+            self.visualizer.generate_visualization(self.sample_data, self.test_output_path)
     
-    @patch("matplotlib.pyplot.figure")
-    @patch("matplotlib.pyplot.bar")
-    @patch("matplotlib.pyplot.savefig")
-    def test_visualization_styling_elements(self, mock_savefig, mock_bar, mock_figure):
+    @patch("matplotlib.axes.Axes.bar", autospec=True, side_effect=Axes.bar)
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_visualization_styling_elements(self, mock_savefig, mock_bar):
         """Test that the visualization includes proper styling elements."""
         # Call the method
         self.visualizer.generate_visualization(self.sample_data, self.test_output_path)
         
-        # Check that figure was created with appropriate size and resolution
-        mock_figure.assert_called_once_with(figsize=(12, 8), dpi=100)
+        # Check that the figure was created with appropriate size and resolution
+        assert tuple(self.visualizer._fig.get_size_inches()) == (12, 8)
+        assert self.visualizer._fig.dpi == 150
         
         # Check that bar was called at least once (for each severity type)
         assert mock_bar.call_count >= len(set(severity for month_data in self.sample_data.values() for severity in month_data))
     
-    def test_color_generation_for_unknown_severity(self):
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_bars_are_stacked_by_severity(self, mock_savefig, sample_np):
+        """Test that each severity layer is drawn with its counts on top of the layers below."""
+        _, severities, counts = sample_np
+        self.visualizer.generate_visualization(self.sample_data, self.test_output_path)
+        
+        containers = self.visualizer._ax.containers
+        assert [c.get_label() for c in containers] == [s.capitalize() for s in severities]
+        
+        heights = np.array([[bar.get_height() for bar in c] for c in containers])
+        bottoms = np.array([[bar.get_y() for bar in c] for c in containers])
+        np.testing.assert_array_equal(heights, counts)
+        np.testing.assert_array_equal(bottoms, np.cumsum(counts, axis=0) - counts)
+    
+    @pytest.mark.parametrize("fig_width, fig_height", [(8, 5), (10, 6), (16, 10)])
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_layout_fits_non_default_figure_sizes(self, mock_savefig, fig_width, fig_height):
+        """Test that the title and axis labels stay inside figures of other sizes."""
+        visualizer = Visualizer(fig_width=fig_width, fig_height=fig_height)
+        # Two years of months, the most that get one labelled tick each
+        data = {f"{2023 + m // 12}-{m % 12 + 1:02d}": {"major": m % 3, "minor": m * 100} for m in range(24)}
+        visualizer.generate_visualization(data, self.test_output_path)
+        
+        # savefig is mocked, so draw the figure to lay out the axis labels
+        fig, ax = visualizer._fig, visualizer._ax
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        for text in (ax.title, ax.xaxis.label, ax.yaxis.label, fig.texts[0]):
+            extent = text.get_window_extent(renderer)
+            assert fig.bbox.x0 <= extent.x0 and extent.x1 <= fig.bbox.x1, text.get_text()
+            assert fig.bbox.y0 <= extent.y0 and extent.y1 <= fig.bbox.y1, text.get_text()
+        visualizer.close()
+    
+    @pytest.mark.parametrize("fig_width, fig_height", [(2, 1), (1, 8), (12, 1)])
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_very_small_figure_sizes_still_render(self, mock_savefig, fig_width, fig_height):
+        """Test that figures too small for the full margins are still rendered and saved."""
+        visualizer = Visualizer(fig_width=fig_width, fig_height=fig_height)
+        visualizer.generate_visualization(self.sample_data, self.test_output_path)
+        
+        mock_savefig.assert_called_once()
+        visualizer.close()
+    
+    @patch("matplotlib.figure.Figure.savefig")
+    def test_figure_is_reused_between_renders(self, mock_savefig):
+        """Test that repeat renders draw on the same, cleared figure."""
+        self.visualizer.generate_visualization(self.sample_data, self.test_output_path)
+        fig = self.visualizer._fig
+        self.visualizer.generate_visualization({"2025-04": {"minor": 2}}, self.test_output_path)
+        
+        # The same figure is reused and only holds the latest render
+        assert self.visualizer._fig is fig
+        assert len(self.visualizer._ax.containers) == 1
+        assert len(fig.texts) == 1
+    
+    def test_generate_many(self, tmp_path):
+        """Test rendering several charts in worker processes."""
+        paths = [str(tmp_path / "first.png"), str(tmp_path / "second.png")]
+        jobs = [(self.sample_data, path, {"dpi": 72}) for path in paths]
+        
+        Visualizer.generate_many(jobs, workers=2)
+        
+        for path in paths:
+            assert os.path.getsize(path) > 0
+    
+    def test_fast_mode_halves_dpi(self):
+        """Test that fast mode renders at half the DPI, but no lower than 72."""
+        assert Visualizer(dpi=150, fast=True).dpi == 75
+        assert Visualizer(dpi=100, fast=True).dpi == 72
+        assert Visualizer(dpi=150).dpi == 150
+    
+    @pytest.mark.parametrize("severity", ["unknown", "different", "outage", "degraded", "security"])
+    def test_color_generation_for_unknown_severity(self, severity):
         """Test that colors are generated consistently for unknown severity types."""
         # Get colors for the same severity multiple times
-        color1 = self.visualizer._get_color_for_severity("unknown")
-        color2 = self.visualizer._get_color_for_severity("unknown")
+        color1 = self.visualizer._get_color_for_severity(severity)
+        color2 = self.visualizer._get_color_for_severity(severity)
         
         # Colors should be consistent for the same severity
         assert color1 == color2
         
-        # Different severities should get different colors
-        color3 = self.visualizer._get_color_for_severity("different")
-        assert color1 != color3
\ No newline at end of file
+        # Colors are derived from the name alone, not per-instance or per-process state
+        assert Visualizer()._get_color_for_severity(severity) == color1
+    
+    def test_colors_differ_between_unknown_severities(self):
+        """Test that different unknown severity types get different colors."""
+        severities = ["unknown", "different", "outage", "degraded", "security"]
+        colors = [self.visualizer._get_color_for_severity(severity) for severity in severities]
+        assert len(set(colors)) == len(colors)
\ No newline at end of file